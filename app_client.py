@@ -0,0 +1,49 @@
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.websocket import websocket_connect
+
+# A bare-bones Streamlit browser: opens the same websocket the frontend uses
+# and asks the server to run the page, so scripts can exercise the app the way
+# a visitor does.
+
+
+class ScriptError(Exception):
+    pass
+
+
+def stream_url(base_url):
+    scheme, netloc, path, _, _ = urlsplit(base_url)
+    scheme = "wss" if scheme == "https" else "ws"
+    return urlunsplit((scheme, netloc, path.rstrip("/") + "/_stcore/stream", "", ""))
+
+
+def health_url(base_url):
+    return base_url.rstrip("/") + "/_stcore/health"
+
+
+async def open_session(base_url, timeout=30):
+    return await websocket_connect(stream_url(base_url), connect_timeout=timeout)
+
+
+async def rerun(connection, query_string=""):
+    # Returns the wall time from the rerun request to script_finished, raising
+    # if the page rendered an exception.
+    message = BackMsg()
+    message.rerun_script.query_string = query_string
+    start = time.perf_counter()
+    await connection.write_message(message.SerializeToString(), binary=True)
+
+    while True:
+        raw = await connection.read_message()
+        if raw is None:
+            raise ScriptError("Connection closed before the script finished")
+        forward = ForwardMsg()
+        forward.ParseFromString(raw)
+        kind = forward.WhichOneof("type")
+        if kind == "delta" and forward.delta.new_element.WhichOneof("type") == "exception":
+            raise ScriptError(forward.delta.new_element.exception.message)
+        if kind == "script_finished":
+            return time.perf_counter() - start
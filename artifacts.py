@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from charts import build_top_n_spec
+from diagnostics import annotate
+from freshness_tables import DEFAULT_TOP_N, build_joined_df, joined_formats, rank_top_countries, top_n_from_ranking
+from read_data import DTYPE_BACKEND
+
+# Render-ready outputs written by precompute.py, one directory per version:
+#
+#   <ARTIFACT_DIR>/<version>/manifest.json        versions, row counts, files
+#   <ARTIFACT_DIR>/<version>/summary.parquet      joined country table
+#   <ARTIFACT_DIR>/<version>/summary.json         the same as display records:
+#                                                 "1,234" counts, "12.3%" shares
+#   <ARTIFACT_DIR>/<version>/top_countries.parquet + .json   MAX_TOP_N ranking
+#   <ARTIFACT_DIR>/<version>/chart-<n>.json + .parquet       chart spec + data
+#   <ARTIFACT_DIR>/latest.json                    {"version": ...}
+#
+# latest.json is swapped in only after a version directory is complete, so the
+# page never sees a half-written set. When ARTIFACT_DIR is unset the page
+# computes everything itself.
+ARTIFACT_DIR = os.environ.get("ARTIFACT_DIR")
+# Bump when the layout above changes so older directories are ignored.
+ARTIFACT_FORMAT = 2
+# Version directories kept besides the latest, for pages still reading them.
+ARTIFACT_KEEP = 2
+
+Artifacts = namedtuple("Artifacts", ["version", "joined", "ranked", "row_ends", "chart_specs"])
+
+
+def artifact_version(snapshots):
+    digest = hashlib.sha1(f"{ARTIFACT_FORMAT}:{DTYPE_BACKEND}".encode())
+    for name in sorted(snapshots):
+        digest.update(f"{name}={snapshots[name].version}".encode())
+    return digest.hexdigest()[:16]
+
+
+def _write_json(path, payload):
+    with open(path + ".tmp", "w") as f:
+        json.dump(payload, f, default=str)
+    os.replace(path + ".tmp", path)
+
+
+def write_artifacts(snapshots, directory=ARTIFACT_DIR, top_ns=(DEFAULT_TOP_N,)):
+    version = artifact_version(snapshots)
+    target = os.path.join(directory, version)
+    if not os.path.exists(os.path.join(target, "manifest.json")):
+        staging = target + ".tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        joined_df = build_joined_df(snapshots["Brand freshness grouped"].df)
+        joined_df.to_parquet(os.path.join(staging, "summary.parquet"), index=False)
+        display_df = joined_df.astype({"Country Code": str}).assign(**{
+            column: joined_df[column].map(number_format.format)
+            for column, number_format in joined_formats(joined_df.columns).items()
+        })
+        display_df.to_json(os.path.join(staging, "summary.json"), orient="records")
+
+        ranked_df, row_ends = rank_top_countries(snapshots["Brand freshness"].df)
+        ranked_df.to_parquet(os.path.join(staging, "top_countries.parquet"), index=False)
+        _write_json(os.path.join(staging, "top_countries.json"), {"row_ends": row_ends.tolist()})
+
+        # The chart data goes to Parquet so its categorical columns survive;
+        # the spec is stored without it and the two are joined on load.
+        for n in top_ns:
+            spec = build_top_n_spec(top_n_from_ranking(ranked_df, row_ends, n))
+            spec.pop("datasets")["top_n"].to_parquet(os.path.join(staging, f"chart-{n}.parquet"), index=False)
+            _write_json(os.path.join(staging, f"chart-{n}.json"), spec)
+
+        _write_json(os.path.join(staging, "manifest.json"), {
+            "version": version,
+            "format": ARTIFACT_FORMAT,
+            "dtype_backend": DTYPE_BACKEND,
+            "created_at": time.time(),
+            "snapshots": {name: snapshot.version for name, snapshot in snapshots.items()},
+            "rows": {"summary": len(joined_df), "top_countries": len(ranked_df)},
+            "top_n": list(top_ns),
+        })
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(staging, target)
+
+    _write_json(os.path.join(directory, "latest.json"), {"version": version})
+    _prune(directory, keep={version})
+    return target
+
+
+def _prune(directory, keep):
+    versions = [
+        entry for entry in os.scandir(directory)
+        if entry.is_dir() and not entry.name.endswith(".tmp") and entry.name not in keep
+    ]
+    versions.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for entry in versions[ARTIFACT_KEEP:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def latest_version(directory=ARTIFACT_DIR):
+    # One small file read per rerun; everything else is cached on the answer.
+    try:
+        with open(os.path.join(directory, "latest.json")) as f:
+            return json.load(f)["version"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return None
+
+
+@st.cache_resource(max_entries=2)
+def load_artifacts(directory, version):
+    annotate(cache="miss")
+    target = os.path.join(directory, version)
+    with open(os.path.join(target, "manifest.json")) as f:
+        manifest = json.load(f)
+    # A set built under the other dtype backend is left to the page to derive.
+    if manifest.get("format") != ARTIFACT_FORMAT or manifest.get("dtype_backend", "numpy") != DTYPE_BACKEND:
+        return None
+
+    with open(os.path.join(target, "top_countries.json")) as f:
+        row_ends = np.asarray(json.load(f)["row_ends"], dtype="int64")
+    chart_specs = {}
+    for n in manifest["top_n"]:
+        with open(os.path.join(target, f"chart-{n}.json")) as f:
+            spec = json.load(f)
+        spec["datasets"] = {"top_n": pd.read_parquet(os.path.join(target, f"chart-{n}.parquet"))}
+        chart_specs[n] = spec
+    return Artifacts(
+        version,
+        pd.read_parquet(os.path.join(target, "summary.parquet")),
+        pd.read_parquet(os.path.join(target, "top_countries.parquet")),
+        row_ends,
+        chart_specs,
+    )
@@ -0,0 +1,141 @@
+"""Time each stage of the brand freshness pipeline on synthetic data.
+
+    python benchmark_pipeline.py --countries 250 --brands 1000000 --repeat 3
+    python benchmark_pipeline.py --dtype-backend numpy pyarrow
+
+Every stage reports its best wall time over the repeats and the peak memory
+seen during one extra run, so regressions show up per stage rather than as
+one slow page load. Peak memory is split into the Python heap (tracemalloc,
+which includes NumPy buffers) and Arrow's memory pool, which tracemalloc
+cannot see. Passing several --dtype-backend values runs the pipeline under
+each and prints the tables one after the other.
+"""
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+import pandas as pd
+import pyarrow as pa
+from streamlit.elements.arrow import marshall
+from streamlit.elements.lib.column_config_utils import marshall_column_config, process_config_mapping
+from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+
+import synthetic_data
+from brand_search import build_search_index, search_brands
+from charts import build_top_n_spec
+from freshness_buckets import BRAND_LEVEL_SHEET, FRESHNESS_EDGES, aggregate_brands
+from freshness_tables import (
+    add_cumulative_columns,
+    build_top_n_df,
+    joined_column_config,
+    joined_table_data,
+    merge_country_tables,
+)
+from read_data import apply_schema
+
+GROUPED = "Brand freshness grouped"
+FLAT = "Brand freshness"
+# A prefix hit, a substring hit and a miss, which scans every name.
+SEARCH_QUERIES = ["brand 12", "345", "no such brand"]
+
+
+def parse(values):
+    return {name: pd.DataFrame(rows[1:], columns=rows[0]) for name, rows in values.items()}
+
+
+def convert(frames, dtype_backend):
+    return {name: apply_schema(name, df, dtype_backend) for name, df in frames.items()}
+
+
+def render_table(joined_df):
+    proto = ArrowProto()
+    marshall(proto, joined_table_data(joined_df), default_uuid="benchmark")
+    marshall_column_config(proto, process_config_mapping(joined_column_config))
+    return proto
+
+
+def stages(brands, values, edges, dtype_backend):
+    state = {}
+    yield "brand bucketing", lambda: aggregate_brands(brands, edges)
+    yield "search index", lambda: state.update(search=build_search_index(brands, edges))
+    yield "brand search", lambda: [search_brands(state["search"], query) for query in SEARCH_QUERIES]
+    yield "parse", lambda: state.update(raw=parse(values))
+    yield "numeric conversion", lambda: state.update(typed=convert(state["raw"], dtype_backend))
+    yield "pivot/groupby/merge", lambda: state.update(merged=merge_country_tables(state["typed"][GROUPED]))
+    yield "cumulative columns", lambda: state.update(joined=add_cumulative_columns(state["merged"]))
+    yield "top-N selection", lambda: state.update(top=build_top_n_df(state["typed"][FLAT]))
+    yield "table rendering", lambda: render_table(state["joined"])
+    yield "chart spec", lambda: build_top_n_spec(state["top"])
+
+
+def measure(func, repeat):
+    # tracemalloc slows allocation-heavy code down several-fold, so time the
+    # plain runs and take the peaks from one extra traced run.
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return (best, *peak_memory(func))
+
+
+def peak_memory(func):
+    # The traced run happens in a forked child: Arrow only reports a peak per
+    # pool, so the child routes allocations through a fresh proxy pool, and
+    # frames allocated from it must not outlive it, which the child's exit
+    # guarantees.
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        arrow_pool = pa.proxy_memory_pool(pa.default_memory_pool())
+        pa.set_memory_pool(arrow_pool)
+        tracemalloc.start()
+        func()
+        peaks = [tracemalloc.get_traced_memory()[1], arrow_pool.max_memory()]
+        os.write(write_fd, json.dumps(peaks).encode())
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        peaks = json.loads(f.read())
+    os.waitpid(pid, 0)
+    return peaks
+
+
+def run(brands, values, edges, repeat, dtype_backend):
+    return [(name, *measure(func, repeat)) for name, func in stages(brands, values, edges, dtype_backend)]
+
+
+def report(results):
+    print(f"{'stage':<22}{'time (ms)':>12}{'heap (MiB)':>12}{'arrow (MiB)':>12}")
+    for name, seconds, heap_peak, arrow_peak in results:
+        print(f"{name:<22}{seconds * 1000:>12.1f}{heap_peak / 2 ** 20:>12.1f}{arrow_peak / 2 ** 20:>12.1f}")
+    print(f"{'total':<22}{sum(r[1] for r in results) * 1000:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--countries", type=int, default=250)
+    parser.add_argument("--brands", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, nargs="+", default=FRESHNESS_EDGES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dtype-backend", nargs="+", choices=["numpy", "pyarrow"], default=["numpy"])
+    args = parser.parse_args()
+
+    brands = synthetic_data.generate_brands(args.countries, args.brands, seed=args.seed)
+    values = {name: synthetic_data.to_sheet_values(df) for name, df in aggregate_brands(brands, args.edges).items()}
+    print(f"{args.countries} countries, {args.brands:,} brands, "
+          f"{sum(len(rows) - 1 for rows in values.values()):,} sheet rows")
+    for dtype_backend in args.dtype_backend:
+        typed_brands = apply_schema(BRAND_LEVEL_SHEET, brands, dtype_backend)
+        print(f"\n{dtype_backend} backend, brand rows take "
+              f"{typed_brands.memory_usage(deep=True).sum() / 2 ** 20:.1f} MiB")
+        report(run(typed_brands, values, args.edges, args.repeat, dtype_backend))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from diagnostics import annotate
+from freshness_buckets import FRESHNESS_EDGES, assign_buckets, bucket_labels, file_age_days
+
+BRAND_PAGE_SIZE = 50
+
+brand_column_config = {
+    "File Age (days)": st.column_config.NumberColumn(format="%d"),
+    "POI Count": st.column_config.NumberColumn(),
+}
+
+# Brand rows sorted by country, then POI count descending, so every country is
+# one contiguous block: brands.iloc[offsets[i]:offsets[i + 1]] for the country
+# at positions[code] = i. A page is a slice of that block, never a filter over
+# the whole table.
+CountryIndex = namedtuple("CountryIndex", ["positions", "offsets", "brands"])
+
+
+def build_country_index(brands, edges=FRESHNESS_EDGES, as_of=None):
+    if isinstance(brands["iso_country_code"].dtype, pd.CategoricalDtype):
+        country = brands["iso_country_code"].cat.codes.to_numpy().astype("int64")
+        countries = brands["iso_country_code"].cat.categories
+    else:
+        country, countries = pd.factorize(brands["iso_country_code"], sort=True)
+    ages = file_age_days(brands, as_of)
+    poi_count = brands["poi_count"].to_numpy()
+
+    order = np.lexsort((-poi_count, country))
+    # Rows without a country sort first and are left out of every block.
+    order = order[country[order] >= 0]
+    sorted_country = country[order]
+    offsets = np.searchsorted(sorted_country, np.arange(len(countries) + 1), side="left")
+
+    labels = bucket_labels(edges)
+    ages = ages[order]
+    indexed = pd.DataFrame({
+        # take() on the column's own array keeps Arrow-backed strings in Arrow
+        "Brand": brands["brand_name"].array.take(order),
+        "Brand ID": brands["brand_id"].array.take(order),
+        "File Age Range": pd.Categorical.from_codes(assign_buckets(ages, edges), categories=labels),
+        "File Age (days)": ages,
+        "POI Count": poi_count[order],
+    })
+    positions = {str(code): i for i, code in enumerate(countries)}
+    return CountryIndex(positions, offsets, indexed)
+
+
+def country_brand_count(index, country):
+    i = index.positions.get(country)
+    return 0 if i is None else int(index.offsets[i + 1] - index.offsets[i])
+
+
+def country_page(index, country, page, page_size=BRAND_PAGE_SIZE):
+    i = index.positions.get(country)
+    if i is None:
+        return index.brands.iloc[:0]
+    start = index.offsets[i] + page * page_size
+    stop = min(start + page_size, index.offsets[i + 1])
+    return index.brands.iloc[start:stop].reset_index(drop=True)
+
+
+# Pages are read-only slices, so one index is shared by every session.
+@st.cache_resource(max_entries=2)
+def country_index(version, _brands_df, as_of):
+    annotate(cache="miss")
+    return build_country_index(_brands_df, as_of=as_of)
@@ -0,0 +1,118 @@
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import ScriptRunContext, add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.state import SafeSessionState, SessionState
+
+import diagnostics
+from artifacts import ARTIFACT_DIR, latest_version, load_artifacts
+from brand_drilldown import country_index
+from brand_search import brand_search_index
+from charts import top_n_chart_spec
+from freshness_buckets import BRAND_LEVEL_SHEET, age_as_of
+from freshness_tables import CUMULATIVE_THRESHOLDS, DEFAULT_TOP_N, joined_table, threshold_label, top_n_table
+from read_data import (
+    INGEST_MODE,
+    ingested_sheets,
+    read_freshness_snapshots,
+    read_snapshots,
+    refresh_due_at,
+    refresh_snapshots,
+)
+from snapshot_history import freshness_trend, history_key, snapshot_comparison, snapshot_versions, week_before
+
+logger = logging.getLogger(__name__)
+
+# One thread per server process keeps the caches a default page view hits
+# filled: it loads everything as soon as the process serves its first run,
+# then re-checks the source WARM_AHEAD seconds before the snapshots turn
+# stale and rebuilds the derived tables for any new version, so visitors
+# never wait on a download or a derivation. CACHE_WARMER=0 turns it off.
+WARMER_ENABLED = os.environ.get("CACHE_WARMER", "1") != "0"
+WARM_AHEAD = 120
+# Shortest sleep between cycles, which is also the retry delay after a failure.
+WARM_MIN_INTERVAL = 30
+
+
+def warm_caches():
+    # The cached calls of a default view of places_brand_freshness.py, with the
+    # same arguments, so the entries filled here are the ones visitors hit.
+    prebuilt = None
+    if ARTIFACT_DIR:
+        version = latest_version()
+        prebuilt = load_artifacts(ARTIFACT_DIR, version) if version else None
+
+    if prebuilt is None:
+        snapshots = read_freshness_snapshots()
+        grouped = snapshots["Brand freshness grouped"]
+        joined_df = joined_table(grouped.version, grouped.df)
+        brand_freshness = snapshots["Brand freshness"]
+        top_df = top_n_table(brand_freshness.version, brand_freshness.df, DEFAULT_TOP_N)
+        top_n_chart_spec(brand_freshness.version, DEFAULT_TOP_N, top_df)
+    else:
+        snapshots = read_snapshots([BRAND_LEVEL_SHEET]) if INGEST_MODE == "brands" else {}
+        joined_df = prebuilt.joined
+
+    snapshot_files = history_key()
+    if len(snapshot_files) > 1:
+        freshness_trend(snapshot_files, tuple(joined_df["Country Code"].astype(str).tolist()[:5]))
+        versions = snapshot_versions(snapshot_files)
+        release = versions["version"].iloc[0]
+        snapshot_comparison(release, week_before(versions, release), threshold_label(CUMULATIVE_THRESHOLDS[0]))
+
+    brands = snapshots.get(BRAND_LEVEL_SHEET)
+    if brands is not None:
+        country_index(brands.version, brands.df, age_as_of(brands.df))
+        brand_search_index(brands.version, brands.df, age_as_of(brands.df))
+
+
+def _run():
+    # No diagnostics.start_run() here: the warmer's own calls stay out of the
+    # logged hit ratio, which is meant to describe what visitors got.
+    sheet_names = ingested_sheets()
+    while True:
+        start = time.perf_counter()
+        warmed = False
+        try:
+            # With nothing on disk yet, warm_caches downloads through the
+            # page's cold-start path, so a first visitor waits on the same
+            # download instead of starting another.
+            due_at = refresh_due_at(sheet_names)
+            if due_at and time.time() >= due_at - WARM_AHEAD:
+                refresh_snapshots(sheet_names)
+            warm_caches()
+            warmed = True
+        except Exception:
+            logger.exception("Cache warming failed")
+        diagnostics.log_cache_stats(warmed=warmed, warm_ms=round((time.perf_counter() - start) * 1000))
+        time.sleep(max(refresh_due_at(sheet_names) - WARM_AHEAD - time.time(), WARM_MIN_INTERVAL))
+
+
+def _warmer_context(page_ctx):
+    # Streamlit's caches are only read and written inside a script run
+    # context, so the warmer gets one of its own: a detached session whose
+    # output goes nowhere, borrowing only the page identity of the run that
+    # started it.
+    return ScriptRunContext(
+        session_id="cache-warmer",
+        _enqueue=lambda msg: None,
+        query_string="",
+        session_state=SafeSessionState(SessionState()),
+        uploaded_file_mgr=page_ctx.uploaded_file_mgr,
+        page_script_hash=page_ctx.page_script_hash,
+        user_info={},
+        gather_usage_stats=False,
+    )
+
+
+@st.cache_resource
+def start_warmer():
+    thread = threading.Thread(target=_run, name="cache-warmer", daemon=True)
+    page_ctx = get_script_run_ctx()
+    if page_ctx is not None:
+        add_script_run_ctx(thread, _warmer_context(page_ctx))
+    thread.start()
+    return thread
@@ -0,0 +1,75 @@
+import json
+
+import altair as alt
+import pandas as pd
+import streamlit as st
+
+from diagnostics import annotate
+from freshness_buckets import ordered_buckets
+from freshness_tables import freshness_list
+
+y_range = [0, 100]
+
+
+def top_n_chart_data(brand_freshness_top_df):
+    # Only what the marks need, under one-letter names: the stacking order and
+    # the fraction shown in the tooltip are derived in the browser instead.
+    return pd.DataFrame({
+        "c": pd.Categorical(brand_freshness_top_df["Country Code"].astype(str)),
+        "a": pd.Categorical(brand_freshness_top_df["File Age Range"].astype(str)),
+        "p": brand_freshness_top_df["Percent of Brands"].round(2).to_numpy(),
+    })
+
+
+def build_top_n_chart(age_ranges=freshness_list):
+    # age_ranges lists the buckets oldest first, the stacking and legend order.
+    return alt.Chart(alt.NamedData(name="top_n")).mark_bar().transform_calculate(
+        o=f"indexof({json.dumps(age_ranges)}, datum.a)",
+        f="datum.p / 100",
+    ).encode(
+        x=alt.X('c:N', sort=None, title=None),
+        y=alt.Y('p:Q', scale=alt.Scale(domain=y_range), title="Percent of Brands"),
+        color=alt.Color('a:N', scale=alt.Scale(domain=age_ranges), title="File Age Range"),
+        order=alt.Order('o:O', sort='descending'),
+        tooltip=[alt.Tooltip('c:N', title="Country Code"),
+                 alt.Tooltip('f:Q', format=",.2%", title="Percent of Brands"),
+                 alt.Tooltip('a:N', title="File Age Range")]
+    ).properties(
+        width=800,
+        height=400
+    ).configure_axisX(
+        labelFontSize=10,  # Set the font size of x-axis labels
+        labelAngle=0
+    )
+
+
+def build_top_n_spec(brand_freshness_top_df):
+    # Same "none" theme st.altair_chart uses, so Streamlit's own theme applies.
+    buckets = ordered_buckets(brand_freshness_top_df["File Age Range"].unique()).categories
+    age_ranges = list(reversed(buckets)) or freshness_list
+    with alt.themes.enable("none"):
+        spec = build_top_n_chart(age_ranges).to_dict()
+    spec["datasets"] = {"top_n": top_n_chart_data(brand_freshness_top_df)}
+    return spec
+
+
+# Shared across sessions; st.vega_lite_chart copies the spec before it pulls
+# the datasets out, so the cached dict is never modified.
+@st.cache_resource(max_entries=32)
+def top_n_chart_spec(version, n, _brand_freshness_top_df):
+    annotate(cache="miss")
+    return build_top_n_spec(_brand_freshness_top_df)
+
+
+def build_trend_chart(trend_df):
+    return alt.Chart(trend_df).mark_line(point=True).encode(
+        x=alt.X('snapshot_time:T', title=None),
+        y=alt.Y('Percent of Brands:Q', scale=alt.Scale(domain=y_range)),
+        color=alt.Color('Country Code:N'),
+        tooltip=[alt.Tooltip('Country Code'),
+                 alt.Tooltip('snapshot_time:T', title="Snapshot"),
+                 alt.Tooltip('Percent of Brands:Q', format=".1f")]
+    ).properties(
+        width=800,
+        height=300
+    )
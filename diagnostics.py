@@ -0,0 +1,91 @@
+import collections
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+# Timing spans for one script run. Streamlit runs each session's script on its
+# own thread, so spans are collected per thread and only while a run has
+# switched them on; when off, a span costs one attribute lookup. Spans around
+# cached calls (those given a cache field) are always tracked far enough to
+# count hits and misses for cache_stats().
+logger = logging.getLogger("diagnostics")
+if not logger.handlers:
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Log spans for every run, not just the ones that asked for the panel.
+ALWAYS_ON = bool(os.environ.get("DIAGNOSTICS"))
+
+_local = threading.local()
+_cache_counts = collections.Counter()
+_cache_lock = threading.Lock()
+
+
+def start_run(enabled=False):
+    _local.spans = [] if enabled or ALWAYS_ON else None
+    _local.open = []
+
+
+def cache_stats(reset=False):
+    # {span name: {"hit": n, "miss": n}} since the last reset.
+    with _cache_lock:
+        stats = {}
+        for (name, outcome), count in _cache_counts.items():
+            stats.setdefault(name, {"hit": 0, "miss": 0})[outcome] = count
+        if reset:
+            _cache_counts.clear()
+    return stats
+
+
+def log_cache_stats(reset=True, **fields):
+    stats = cache_stats(reset)
+    hits = sum(counts["hit"] for counts in stats.values())
+    calls = hits + sum(counts["miss"] for counts in stats.values())
+    logger.info(json.dumps({
+        "cache_hit_ratio": round(hits / calls, 4) if calls else None,
+        "calls": calls,
+        "by_span": stats,
+        **fields,
+    }))
+
+
+def spans():
+    return list(getattr(_local, "spans", None) or [])
+
+
+def annotate(**fields):
+    # Tag the innermost open span, e.g. from inside a cached function body,
+    # which only runs on a miss.
+    open_spans = getattr(_local, "open", None)
+    if open_spans:
+        open_spans[-1].update(fields)
+
+
+@contextlib.contextmanager
+def span(name, **fields):
+    collected = getattr(_local, "spans", None)
+    open_spans = getattr(_local, "open", None)
+    if open_spans is None or (collected is None and "cache" not in fields):
+        yield
+        return
+
+    record = {"span": name, **fields}
+    open_spans.append(record)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record["ms"] = round((time.perf_counter() - start) * 1000, 3)
+        open_spans.pop()
+        if "cache" in record:
+            with _cache_lock:
+                _cache_counts[name, record["cache"]] += 1
+        if collected is not None:
+            collected.append(record)
+            logger.info(json.dumps(record, default=str))
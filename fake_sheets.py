@@ -0,0 +1,79 @@
+import threading
+import time
+
+from gspread.exceptions import APIError
+from gspread.utils import a1_to_rowcol
+
+
+class FakeSpreadsheet:
+    """In-memory stand-in for a gspread Spreadsheet.
+
+    Serves ``values_batch_get`` from a dict of worksheet name to rows (header
+    row first), answers the Drive modified-time lookup from ``modified_time``
+    and counts the requests it receives, so loaders can be exercised offline.
+    Each request sleeps ``latency`` plus ``latency_per_range`` for every range
+    it asks for, the way a batch of large worksheets takes longer to serve;
+    ``max_in_flight`` records how many requests were ever being served at once.
+    ``errors`` is a list of HTTP status codes, or None for a success; the next
+    requests fail with an ``APIError`` carrying each of them in turn before the
+    fake answers again.
+    """
+
+    id = "fake-spreadsheet"
+
+    def __init__(self, worksheets, latency=0.0, latency_per_range=0.0, errors=(), modified_time="2023-01-01T00:00:00.000Z"):
+        self.worksheets = worksheets
+        self.latency = latency
+        self.latency_per_range = latency_per_range
+        self.errors = list(errors)
+        self.modified_time = modified_time
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.client = self
+        self._lock = threading.Lock()
+
+    def _request(self, ranges=0):
+        with self._lock:
+            self.requests += 1
+            status = self.errors.pop(0) if self.errors else None
+        if status is not None:
+            raise APIError(_FakeResponse({"error": {"code": status, "message": "Injected error"}}, status))
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay = self.latency + self.latency_per_range * ranges
+            if delay:
+                time.sleep(delay)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def values_batch_get(self, ranges, params=None):
+        self._request(len(ranges))
+        value_ranges = []
+        for range_name in ranges:
+            sheet_name = range_name.split("!")[0].strip("'")
+            value_ranges.append({"range": range_name, "values": self.worksheets[sheet_name]})
+        return {"valueRanges": value_ranges}
+
+    def values_get(self, range_name, params=None):
+        self._request(1)
+        sheet_name, _, cell = range_name.partition("!")
+        row, column = a1_to_rowcol(cell)
+        return {"range": range_name, "values": [[self.worksheets[sheet_name.strip("'")][row - 1][column - 1]]]}
+
+    def request(self, method, url, params=None, **kwargs):
+        self._request()
+        return _FakeResponse({"id": self.id, "modifiedTime": self.modified_time})
+
+
+class _FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+        self.text = str(payload)
+
+    def json(self):
+        return self.payload
@@ -0,0 +1,121 @@
+import math
+import re
+
+import numpy as np
+import pandas as pd
+
+# Brand-level rows, one per brand and country: iso_country_code, brand_id,
+# brand_name, poi_count and either file_age_days or last_updated.
+BRAND_LEVEL_SHEET = "Brand freshness by brand"
+
+# Upper edges of the closed freshness buckets, in days; everything past the
+# last edge lands in the open-ended bucket.
+FRESHNESS_EDGES = [30, 60, 90, 120]
+
+
+def bucket_labels(edges):
+    labels = []
+    lower = 0
+    for upper in edges:
+        labels.append(f"{lower}-{upper}d")
+        lower = upper + 1
+    labels.append(f"{edges[-1]}d+")
+    return labels
+
+
+def bucket_bounds(label):
+    # (lower, upper) days of a "31-60d" or "120d+" label, upper being inf for
+    # the open-ended bucket; None for anything that is not a bucket label.
+    match = re.fullmatch(r"(\d+)-(\d+)d", str(label))
+    if match:
+        return int(match[1]), int(match[2])
+    match = re.fullmatch(r"(\d+)d\+", str(label))
+    if match:
+        return int(match[1]), math.inf
+    return None
+
+
+def ordered_buckets(labels):
+    # Ordered categorical dtype over the bucket labels present, youngest first,
+    # whatever edges produced them.
+    present = {str(label) for label in labels if bucket_bounds(label) is not None}
+    return pd.CategoricalDtype(sorted(present, key=bucket_bounds), ordered=True)
+
+
+def cumulative_shares(shares, buckets, thresholds):
+    # shares is one row per country and one column per bucket in `buckets`
+    # order, zero where a country has no brands in a bucket. One cumulative sum
+    # across the buckets serves every threshold: "< T days" is the running
+    # total up to the last bucket whose upper edge is at or below T.
+    upper = np.array([bucket_bounds(bucket)[1] for bucket in buckets], dtype="float64")
+    running = np.cumsum(shares, axis=1)
+    running = np.hstack([np.zeros((len(running), 1)), running])
+    return running[:, np.searchsorted(upper, thresholds, side="right")]
+
+
+def age_as_of(brands):
+    # The date ages are counted to when rows only carry last_updated; callers
+    # caching on a snapshot version add it to the key so ages move day by day.
+    # None when the rows carry their ages, which then never go stale.
+    return None if "file_age_days" in brands else pd.Timestamp.now().normalize()
+
+
+def file_age_days(brands, as_of=None):
+    if "file_age_days" in brands:
+        return brands["file_age_days"].to_numpy()
+    as_of = pd.Timestamp.now().normalize() if as_of is None else pd.Timestamp(as_of)
+    return (as_of - pd.to_datetime(brands["last_updated"])).dt.days.to_numpy()
+
+
+def assign_buckets(ages, edges):
+    # side="left" puts an age equal to an edge in the bucket that edge closes,
+    # so 30 days is "0-30d" and 31 days is "31-60d".
+    return np.searchsorted(np.asarray(edges), ages, side="left")
+
+
+def aggregate_brands(brands, edges=FRESHNESS_EDGES, as_of=None):
+    labels = bucket_labels(edges)
+    n_buckets = len(labels)
+
+    if isinstance(brands["iso_country_code"].dtype, pd.CategoricalDtype):
+        country = brands["iso_country_code"].cat.codes.to_numpy().astype("int64")
+        countries = brands["iso_country_code"].cat.categories
+    else:
+        country, countries = pd.factorize(brands["iso_country_code"], sort=True)
+    bucket = assign_buckets(file_age_days(brands, as_of), edges)
+    poi_count = brands["poi_count"].to_numpy()
+
+    # Rows without a country cannot be placed in the table.
+    valid = country >= 0
+    if not valid.all():
+        country, bucket, poi_count = country[valid], bucket[valid], poi_count[valid]
+
+    # One grouped count over a combined (country, bucket) key.
+    counts = np.bincount(country * n_buckets + bucket, minlength=len(countries) * n_buckets)
+    counts = counts.reshape(len(countries), n_buckets)
+    poi = np.bincount(country, weights=poi_count, minlength=len(countries)).astype("int64")
+
+    present = counts.sum(axis=1) > 0
+    counts, poi, countries = counts[present], poi[present], np.asarray(countries)[present]
+    totals = counts.sum(axis=1)
+    rank = np.empty(len(poi), dtype="int64")
+    rank[np.argsort(-poi, kind="stable")] = np.arange(1, len(poi) + 1)
+
+    country_code = pd.Categorical(np.repeat(countries, n_buckets))
+    file_age_range = pd.Categorical(np.tile(labels, len(countries)), categories=labels)
+    grouped = pd.DataFrame({
+        "tidy_country_code": country_code,
+        "file_age_range": file_age_range,
+        "brand_count": counts.ravel(),
+        "country_brand_count": np.repeat(totals, n_buckets),
+        "pct_of_brands": counts.ravel() / np.repeat(totals, n_buckets),
+        "tidy_country_rank": np.repeat(rank, n_buckets),
+        "country_poi_count": np.repeat(poi, n_buckets),
+    })
+    flat = pd.DataFrame({
+        "iso_country_code": country_code,
+        "file_age_range": file_age_range,
+        "country_poi_count": grouped["country_poi_count"],
+        "pct_of_brands": grouped["pct_of_brands"],
+    })
+    return {"Brand freshness grouped": grouped, "Brand freshness": flat}
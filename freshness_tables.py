@@ -0,0 +1,190 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from diagnostics import annotate
+from freshness_buckets import cumulative_shares, ordered_buckets
+
+freshness_list = ['120d+', '91-120d', '61-90d', '31-60d', '0-30d']
+
+# Cumulative "% of brand freshness < T days" columns, in days. Each counts the
+# buckets whose upper edge is at or below T, so thresholds should sit on
+# bucket edges.
+CUMULATIVE_THRESHOLDS = [30, 60, 90]
+
+STYLED_MAX_ROWS = 1000
+# Countries ranked up front for the top-N chart; any N up to this is a slice.
+MAX_TOP_N = 100
+DEFAULT_TOP_N = 30
+
+
+
+def threshold_label(threshold):
+    return f"< {threshold} days"
+
+
+def cumulative_column(threshold):
+    return f"% of brand freshness {threshold_label(threshold)}"
+
+
+# Formats for tables past STYLED_MAX_ROWS, which reach the grid as plain
+# Arrow; a NumberColumn without a format groups digits like "{:,.0f}" does.
+joined_column_config = {
+    "Distinct Brand Count": st.column_config.NumberColumn(),
+    **{cumulative_column(t): st.column_config.NumberColumn(format="%.1f%%") for t in CUMULATIVE_THRESHOLDS},
+}
+
+
+def numpy_values(series):
+    # pandas 2.0 runs grouped reductions over Arrow-backed values one group at
+    # a time in Python; reducing a NumPy view of them is ~100x faster, and the
+    # group keys stay Arrow-backed either way.
+    return pd.Series(series.to_numpy(), index=series.index, name=series.name)
+
+
+def merge_country_tables(brand_freshness_grouped_df):
+    buckets = ordered_buckets(brand_freshness_grouped_df['file_age_range'].unique())
+    brand_freshness_grouped_df = brand_freshness_grouped_df.assign(
+        pct_of_brands=brand_freshness_grouped_df['pct_of_brands'] * 100,
+        file_age_range=brand_freshness_grouped_df['file_age_range'].astype(buckets),
+    )
+
+    # pivoted table, one column per bucket in age order; a bucket a country has
+    # no brands in is 0 rather than missing
+    reshaped_df = brand_freshness_grouped_df.pivot(index='tidy_country_code', columns='file_age_range', values='pct_of_brands')
+    reshaped_df = reshaped_df.reindex(columns=buckets.categories).fillna(0)
+    reshaped_df.columns = list(buckets.categories)
+    reshaped_df = reshaped_df.reset_index()
+
+    # brand totals by country
+    brand_count = brand_freshness_grouped_df['brand_count']
+    brand_totals_df = numpy_values(brand_count).groupby(
+        [brand_freshness_grouped_df['tidy_country_code'], brand_freshness_grouped_df['tidy_country_rank']], observed=True
+    ).sum().astype(brand_count.dtype).reset_index()
+
+    # joined table
+    joined_df = pd.merge(brand_totals_df, reshaped_df, on='tidy_country_code', how='inner')
+    column_order = ['tidy_country_code', 'tidy_country_rank', 'brand_count', *buckets.categories]
+    return joined_df[column_order].sort_values(by='tidy_country_rank', ascending=True).reset_index(drop=True)
+
+
+def add_cumulative_columns(joined_df, thresholds=CUMULATIVE_THRESHOLDS):
+    buckets = list(ordered_buckets(joined_df.columns).categories)
+    cumulative = cumulative_shares(joined_df[buckets].to_numpy(dtype="float64"), buckets, thresholds)
+    # The sums are taken in NumPy and typed back like the bucket columns, so
+    # Arrow-backed input gives Arrow-backed output.
+    share_dtype = joined_df[buckets[0]].dtype
+    return pd.DataFrame({
+        "Country Code": joined_df["tidy_country_code"].array,
+        "Distinct Brand Count": joined_df["brand_count"].array,
+        **{cumulative_column(t): pd.array(cumulative[:, i], dtype=share_dtype) for i, t in enumerate(thresholds)},
+    })
+
+
+def build_joined_df(brand_freshness_grouped_df):
+    return add_cumulative_columns(merge_country_tables(brand_freshness_grouped_df))
+
+
+def joined_formats(columns):
+    # Display formats of the styled table, shared with the exported summary.
+    return {
+        "Distinct Brand Count": "{:,.0f}",
+        **{column: "{:.1f}%" for column in columns if column.startswith("% of brand freshness")},
+    }
+
+
+def style_joined_df(joined_df):
+    # Striping every other row; the CSS frame is built in one vectorized step
+    # instead of a Python callback per column.
+    stripes = np.where(np.arange(len(joined_df)) % 2 == 0, 'background-color: #D7E8ED', '')
+    css = pd.DataFrame(
+        np.repeat(stripes[:, None], joined_df.shape[1], axis=1),
+        index=joined_df.index,
+        columns=joined_df.columns,
+    )
+    return (
+        joined_df.style
+        .apply(lambda _: css, axis=None)
+        .format(joined_formats(joined_df.columns))
+    )
+
+
+def joined_table_data(joined_df):
+    # A Styler makes Streamlit serialize a CSS class and display string for
+    # every cell, which is fine for a country table but not for 100k rows.
+    # Past STYLED_MAX_ROWS the frame goes out as plain Arrow and the grid
+    # formats it from joined_column_config, without striping.
+    if len(joined_df) > STYLED_MAX_ROWS:
+        return joined_df
+    return style_joined_df(joined_df)
+
+
+def rank_top_countries(brand_freshness_df, max_n=MAX_TOP_N):
+    # Rank countries, not POI counts: one O(rows) pass for each country's
+    # count, then a partial selection of the max_n largest, so two countries
+    # with the same count cannot push the chart past n.
+    country_poi = numpy_values(brand_freshness_df["country_poi_count"]).groupby(
+        brand_freshness_df["iso_country_code"], observed=True, sort=False
+    ).max()
+    top_countries = country_poi.nlargest(max_n, keep="first").index
+
+    ranked_df = brand_freshness_df[
+        brand_freshness_df["iso_country_code"].isin(top_countries)
+    ]
+    position = ranked_df["iso_country_code"].map(
+        pd.Series(range(len(top_countries)), index=top_countries)
+    ).to_numpy(dtype="int64")
+    order = position.argsort(kind="stable")
+    ranked_df = ranked_df.iloc[order]
+
+    ranked_df = pd.DataFrame({
+        # An ordered categorical under either backend: its categories are the
+        # ranking itself, which top_n_from_ranking trims per slice.
+        "Country Code": pd.Categorical(
+            ranked_df["iso_country_code"].astype(str),
+            categories=top_countries.astype(str),
+            ordered=True,
+        ),
+        # .array keeps Arrow-backed columns Arrow-backed
+        "File Age Range": ranked_df["file_age_range"].array,
+        "country_poi_count": ranked_df["country_poi_count"].array,
+        "Percent of Brands": ranked_df["pct_of_brands"].array * 100,
+    })
+    # Rows are grouped by rank, so the first n countries are a prefix of the
+    # frame ending at row_ends[n - 1].
+    row_ends = np.bincount(position, minlength=len(top_countries)).cumsum()
+    return ranked_df, row_ends
+
+
+def top_n_from_ranking(ranked_df, row_ends, n):
+    n = min(n, len(row_ends))
+    top_df = ranked_df.iloc[:row_ends[n - 1]] if n else ranked_df.iloc[:0]
+    return top_df.assign(**{"Country Code": top_df["Country Code"].cat.remove_unused_categories()})
+
+
+def build_top_n_df(brand_freshness_df, n=DEFAULT_TOP_N):
+    return top_n_from_ranking(*rank_top_countries(brand_freshness_df, n), n)
+
+
+# The derived tables only change when the snapshot does, so they are cached on
+# its content hash; the frame argument is underscored so Streamlit does not
+# hash it again on every rerun. They are shared, read-only resources; see
+# read_data.
+@st.cache_resource(max_entries=4)
+def joined_table(version, _brand_freshness_grouped_df):
+    annotate(cache="miss")
+    return build_joined_df(_brand_freshness_grouped_df)
+
+
+@st.cache_resource(max_entries=4)
+def top_country_ranking(version, _brand_freshness_df):
+    annotate(cache="miss")
+    return rank_top_countries(_brand_freshness_df)
+
+
+@st.cache_resource(max_entries=32)
+def top_n_table(version, _brand_freshness_df, n):
+    annotate(cache="miss")
+    if n > MAX_TOP_N:
+        return build_top_n_df(_brand_freshness_df, n)
+    return top_n_from_ranking(*top_country_ranking(version, _brand_freshness_df), n)
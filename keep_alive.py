@@ -0,0 +1,41 @@
+"""Keep the deployed app awake without touching the repository.
+
+    python keep_alive.py https://<app>.streamlit.app
+
+Checks the health route, then opens one websocket session and runs the page
+once, so the visit counts as a viewer and leaves the caches warm. Exits
+non-zero if any step fails, for the scheduler to report.
+"""
+import argparse
+import asyncio
+import sys
+import urllib.request
+
+from app_client import health_url, open_session, rerun
+
+
+async def visit(base_url, timeout):
+    connection = await open_session(base_url, timeout)
+    try:
+        return await asyncio.wait_for(rerun(connection), timeout)
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("url")
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    try:
+        with urllib.request.urlopen(health_url(args.url), timeout=args.timeout) as response:
+            print(f"health: {response.status} {response.read().decode().strip()}")
+        print(f"page run: {asyncio.run(visit(args.url, args.timeout)):.2f}s")
+    except Exception as e:
+        print(f"keep-alive failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
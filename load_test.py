@@ -0,0 +1,173 @@
+"""Measure how many concurrent sessions one app process can serve.
+
+    python load_test.py --concurrency 1 4 16 64 --reruns 5
+    python load_test.py --ingest brands --brands 1000000 --query country=AA --query top_n=50
+
+Writes synthetic worksheets to a temporary directory, starts
+places_brand_freshness.py against them with DATA_SOURCE=files:<dir>, and
+drives simulated sessions over the websocket the browser uses. At each
+concurrency level every session opens its own connection and reruns the page
+--reruns times, cycling sessions through the --query strings. The report
+gives rerun latency percentiles, completed reruns per second and the server's
+resident memory: before the level, its peak during it, and the growth over
+the warm single-session baseline. --env passes extra settings such as
+DTYPE_BACKEND=pyarrow through to the server.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import numpy as np
+
+import synthetic_data
+from app_client import ScriptError, health_url, open_session, rerun
+from freshness_buckets import BRAND_LEVEL_SHEET, aggregate_brands
+from sources import slug
+
+PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "places_brand_freshness.py")
+
+
+def write_sources(directory, ingest, n_countries, n_brands, seed):
+    brands = synthetic_data.generate_brands(n_countries, n_brands, seed=seed)
+    frames = {BRAND_LEVEL_SHEET: brands} if ingest == "brands" else aggregate_brands(brands)
+    for name, df in frames.items():
+        df.to_parquet(os.path.join(directory, slug(name) + ".parquet"), index=False)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("localhost", 0))
+        return s.getsockname()[1]
+
+
+def start_server(workdir, port, env, timeout):
+    log = open(os.path.join(workdir, "server.log"), "w")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", PAGE, "--server.port", str(port),
+         "--server.headless", "true", "--global.developmentMode", "false",
+         "--browser.gatherUsageStats", "false"],
+        env=env, cwd=workdir, stdout=log, stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            break
+        try:
+            urllib.request.urlopen(health_url(f"http://localhost:{port}"), timeout=1)
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError(f"Server did not come up, see {log.name}")
+
+
+def rss_mib(pid):
+    # Linux only; elsewhere memory columns read n/a.
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+async def session(base_url, query, reruns, latencies, errors):
+    connection = await open_session(base_url)
+    try:
+        for _ in range(reruns):
+            try:
+                latencies.append(await rerun(connection, query))
+            except ScriptError as e:
+                errors.append(str(e))
+    finally:
+        connection.close()
+
+
+async def sample_rss(pid, peak, interval=0.05):
+    while True:
+        peak[0] = max(peak[0], rss_mib(pid))
+        await asyncio.sleep(interval)
+
+
+async def run_level(base_url, pid, concurrency, reruns, queries):
+    latencies, errors = [], []
+    before = rss_mib(pid)
+    peak = [before]
+    sampler = asyncio.create_task(sample_rss(pid, peak))
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*[
+            session(base_url, queries[i % len(queries)], reruns, latencies, errors)
+            for i in range(concurrency)
+        ])
+    finally:
+        elapsed = time.perf_counter() - start
+        sampler.cancel()
+    peak[0] = max(peak[0], rss_mib(pid))
+    return latencies, errors, elapsed, before, peak[0]
+
+
+async def load_test(base_url, pid, levels, reruns, queries):
+    cold = []
+    await session(base_url, queries[0], 1, cold, [])
+    await session(base_url, queries[0], 2, [], [])
+    baseline = rss_mib(pid)
+    print(f"cold load {cold[0] * 1000:.0f} ms, warm RSS {baseline:.0f} MiB" if cold else "cold load failed")
+
+    print(f"{'sessions':>8}{'reruns':>8}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'reruns/s':>10}{'RSS MiB':>9}{'peak MiB':>10}{'growth':>8}")
+    for concurrency in levels:
+        latencies, errors, elapsed, before, peak = await run_level(base_url, pid, concurrency, reruns, queries)
+        p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99]) if latencies else [float("nan")] * 3
+        print(f"{concurrency:>8}{len(latencies):>8}{len(errors):>8}{p50:>9.0f}{p95:>9.0f}{p99:>9.0f}"
+              f"{len(latencies) / elapsed:>10.1f}{before:>9.0f}{peak:>10.0f}{peak - baseline:>8.0f}")
+        for message in sorted(set(errors)):
+            print(f"  error: {message}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--reruns", type=int, default=5, help="reruns per session at each level")
+    parser.add_argument("--query", action="append", help="query string for a session's reruns; repeatable")
+    parser.add_argument("--ingest", choices=["sheets", "brands"], default="sheets")
+    parser.add_argument("--countries", type=int, default=250)
+    parser.add_argument("--brands", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--env", action="append", default=[], metavar="NAME=VALUE",
+                        help="extra environment for the server; repeatable")
+    parser.add_argument("--startup-timeout", type=float, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="load-test-") as workdir:
+        data_dir = os.path.join(workdir, "data")
+        os.makedirs(data_dir)
+        write_sources(data_dir, args.ingest, args.countries, args.brands, args.seed)
+        env = dict(
+            os.environ,
+            DATA_SOURCE=f"files:{data_dir}",
+            INGEST_MODE=args.ingest,
+            SNAPSHOT_DIR=os.path.join(workdir, "snapshots"),
+            HISTORY_DIR=os.path.join(workdir, "history"),
+        )
+        env.update(setting.split("=", 1) for setting in args.env)
+
+        port = free_port()
+        server = start_server(workdir, port, env, args.startup_timeout)
+        try:
+            asyncio.run(load_test(f"http://localhost:{port}", server.pid, args.concurrency, args.reruns, args.query or [""]))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
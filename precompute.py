@@ -0,0 +1,42 @@
+"""Build the page's tables and chart ahead of time.
+
+    ARTIFACT_DIR=artifacts python precompute.py --top-n 10 30 50
+
+Refreshes the snapshots from the source, loads the worksheets through the
+same loader as places_brand_freshness.py (snapshots, DATA_SOURCE, INGEST_MODE
+and history included), derives the joined table, the top-country ranking and
+the chart specs, and writes them under ARTIFACT_DIR. A page started with the same ARTIFACT_DIR serves them as they
+are. Run it from cron after each data release; an unchanged release is a
+no-op apart from the freshness check, and a failed refresh exits non-zero.
+"""
+import argparse
+import logging
+import sys
+
+import artifacts
+from freshness_tables import DEFAULT_TOP_N, MAX_TOP_N
+from read_data import ingested_sheets, read_freshness_snapshots, refresh_snapshots
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=artifacts.ARTIFACT_DIR, help="defaults to $ARTIFACT_DIR")
+    parser.add_argument("--top-n", type=int, nargs="+", default=[DEFAULT_TOP_N],
+                        help="chart sizes to prebuild; others are sliced from the ranking at view time")
+    args = parser.parse_args()
+    if not args.out:
+        parser.error("set ARTIFACT_DIR or pass --out")
+    if any(not 1 <= n <= MAX_TOP_N for n in args.top_n):
+        parser.error(f"--top-n values must be between 1 and {MAX_TOP_N}")
+
+    logging.basicConfig(level=logging.INFO)
+    # The page's loader serves whatever is on disk and refreshes in a daemon
+    # thread that would die with this process, so fetch the release here first.
+    if not refresh_snapshots(ingested_sheets()):
+        sys.exit("precompute failed: could not refresh the snapshots")
+    target = artifacts.write_artifacts(read_freshness_snapshots(), args.out, tuple(sorted(set(args.top_n))))
+    print(target)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,342 @@
-import gspread
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import pandas as pd
-from oauth2client.service_account import ServiceAccountCredentials
+import pyarrow as pa
+
+from diagnostics import annotate, span
+from freshness_buckets import BRAND_LEVEL_SHEET, FRESHNESS_EDGES, age_as_of, aggregate_brands
+from snapshot_history import HISTORY_SHEET, record_snapshot
+from sources import DATA_SOURCE, QuotaExhausted, get_source, slug
+
+logger = logging.getLogger(__name__)
+
+# Loaded and derived frames are cached with st.cache_resource, which hands
+# every session the same object instead of an unpickled copy, so nothing may
+# modify them in place. Copy-on-write makes that hold for anything derived
+# from them too: slices and assigns copy only what they change and can never
+# write through to a cached frame.
+pd.set_option("mode.copy_on_write", True)
+
+# Worksheets are persisted here as Parquet so restarts and redeploys serve the
+# last download straight from disk instead of waiting on the data source.
+SNAPSHOT_DIR = os.environ.get("SNAPSHOT_DIR", ".snapshots")
+# How long a snapshot is served before the source is asked whether it has
+# changed. The check is a single tiny request, the full download only happens
+# when the answer is yes, so this can be much shorter than a full refresh.
+SNAPSHOT_TTL = 900
+# Bump when the on-disk layout or column types change so old snapshots are
+# re-fetched instead of served.
+SNAPSHOT_FORMAT = 3
+# "numpy" keeps the classic NumPy/object columns; "pyarrow" stores every
+# column, including the unlisted string ones, as an Arrow-backed dtype, so
+# the frames go to Parquet and Streamlit's Arrow serializer without being
+# converted.
+DTYPE_BACKEND = os.environ.get("DTYPE_BACKEND", "numpy")
+# Upper bound on concurrent fetch requests to the source. The default of 1
+# fetches every worksheet in a single batched request, one unit of Sheets
+# quota per refresh. Raising it splits the batch and fetches the parts in
+# parallel: a cold load then waits for the slowest part instead of the whole
+# batch, which only pays off when the worksheets are large, and every extra
+# part costs another request.
+FETCH_WORKERS = max(1, int(os.environ.get("FETCH_WORKERS", 1)))
+
+# Column types per worksheet, applied once at fetch time whatever the source,
+# so the snapshots and everything downstream work with numbers and
+# categoricals rather than text. Columns that are not listed stay as strings.
+# Under the pyarrow backend each type maps through ARROW_DTYPES.
+SHEET_SCHEMAS = {
+    "Brand freshness grouped": {
+        "tidy_country_code": "category",
+        "file_age_range": "category",
+        "brand_count": "int64",
+        "country_brand_count": "int64",
+        "pct_of_brands": "float64",
+        "tidy_country_rank": "int64",
+        "country_poi_count": "int64",
+    },
+    "Brand freshness": {
+        "iso_country_code": "category",
+        "file_age_range": "category",
+        "country_poi_count": "int64",
+        "pct_of_brands": "float64",
+    },
+    BRAND_LEVEL_SHEET: {
+        "iso_country_code": "category",
+        "poi_count": "int64",
+        "file_age_days": "int64",
+        "last_updated": "datetime64[ns]",
+    },
+}
+
+ARROW_DTYPES = {
+    "category": pd.ArrowDtype(pa.string()),
+    "int64": pd.ArrowDtype(pa.int64()),
+    "float64": pd.ArrowDtype(pa.float64()),
+    "datetime64[ns]": pd.ArrowDtype(pa.timestamp("ns")),
+}
+
+FRESHNESS_SHEETS = ["Brand freshness grouped", "Brand freshness"]
+# "sheets" reads the pre-bucketed worksheets; "brands" reads brand-level rows
+# and buckets them locally with FRESHNESS_EDGES.
+INGEST_MODE = os.environ.get("INGEST_MODE", "sheets")
+
+Snapshot = namedtuple("Snapshot", ["version", "df"])
+
+_fetch_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+_refreshing = set()
+
+
+def apply_schema(sheet_name, df, dtype_backend=None):
+    dtype_backend = dtype_backend or DTYPE_BACKEND
+    schema = SHEET_SCHEMAS.get(sheet_name, {})
+    columns = {}
+    for column, dtype in schema.items():
+        if column not in df:
+            continue
+        target = ARROW_DTYPES[dtype] if dtype_backend == "pyarrow" else dtype
+        if dtype == "category":
+            columns[column] = df[column].astype(target)
+        elif dtype.startswith("datetime"):
+            columns[column] = pd.to_datetime(df[column]).astype(target)
+        else:
+            columns[column] = pd.to_numeric(df[column]).astype(target)
+    if dtype_backend == "pyarrow":
+        for column in df.columns:
+            if column not in schema and df[column].dtype == object:
+                columns[column] = df[column].astype(ARROW_DTYPES["category"])
+    return df.assign(**columns)
+
+
+def _stamp_path(sheet_name):
+    return os.path.join(SNAPSHOT_DIR, slug(sheet_name) + ".json")
+
+
+def _read_stamp(sheet_name):
+    try:
+        with open(_stamp_path(sheet_name)) as f:
+            stamp = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    # Snapshots written by another loader version, source or dtype backend
+    # are not ours to serve.
+    if (
+        stamp.get("format") != SNAPSHOT_FORMAT
+        or stamp.get("source") != DATA_SOURCE
+        or stamp.get("dtype_backend", "numpy") != DTYPE_BACKEND
+    ):
+        return None
+    return stamp
+
+
+def _content_version(df):
+    digest = hashlib.sha1("\x1f".join(df.columns).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _write_stamp(sheet_name, stamp):
+    stamp_path = _stamp_path(sheet_name)
+    with open(stamp_path + ".tmp", "w") as f:
+        json.dump(stamp, f)
+    os.replace(stamp_path + ".tmp", stamp_path)
+    return stamp
+
+
+def _write_snapshot(sheet_name, df, signal=None):
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    previous = _read_stamp(sheet_name) or {"path": None}
+    version = _content_version(df)
+    # The content hash is blind to how columns are typed (a categorical and an
+    # Arrow string column hash alike), so the name also carries the layout
+    # and backend the file was written with.
+    path = os.path.join(SNAPSHOT_DIR, f"{slug(sheet_name)}-{version}-{DTYPE_BACKEND}-f{SNAPSHOT_FORMAT}.parquet")
+    if not os.path.exists(path):
+        df.to_parquet(path + ".tmp", index=False)
+        os.replace(path + ".tmp", path)
+
+    stamp = _write_stamp(sheet_name, {
+        "version": version,
+        "path": path,
+        "fetched_at": time.time(),
+        "signal": signal,
+        "source": DATA_SOURCE,
+        "format": SNAPSHOT_FORMAT,
+        "dtype_backend": DTYPE_BACKEND,
+    })
+
+    # Keep the previous file around so a reader holding the old stamp can
+    # still open it; anything older than that is garbage.
+    keep = {path, previous["path"]}
+    prefix = slug(sheet_name) + "-"
+    for name in os.listdir(SNAPSHOT_DIR):
+        old = os.path.join(SNAPSHOT_DIR, name)
+        if name.startswith(prefix) and name.endswith(".parquet") and old not in keep:
+            os.remove(old)
+    return stamp
+
+
+def _fetch_and_store(source, sheet_names, signal):
+    return {
+        sheet_name: _write_snapshot(sheet_name, apply_schema(sheet_name, df), signal)
+        for sheet_name, df in source.fetch(sheet_names).items()
+    }
+
+
+def _download(sheet_names):
+    # Read the signal before the values so an edit landing mid-download is
+    # picked up by the next check rather than hidden behind a matching stamp.
+    source = get_source()
+    try:
+        signal = source.signal()
+    except QuotaExhausted:
+        raise
+    except Exception:
+        # The change check is an optimization: without it, download everything
+        # and store no signal, so the next check downloads again.
+        logger.exception("Change check failed, downloading %r without it", sheet_names)
+        signal = None
+
+    stamps = {}
+    changed = []
+    for sheet_name in sheet_names:
+        stamp = _read_stamp(sheet_name)
+        if stamp is not None and signal is not None and stamp["signal"] == signal:
+            stamps[sheet_name] = _write_stamp(sheet_name, {**stamp, "fetched_at": time.time()})
+        else:
+            changed.append(sheet_name)
+
+    if changed:
+        # Split the worksheets round-robin over at most FETCH_WORKERS batched
+        # requests and run those concurrently, so a cold load waits for the
+        # slowest group rather than the sum of all of them.
+        groups = [changed[i::FETCH_WORKERS] for i in range(min(FETCH_WORKERS, len(changed)))]
+        if len(groups) == 1:
+            stamps.update(_fetch_and_store(source, groups[0], signal))
+        else:
+            with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+                for group_stamps in pool.map(lambda group: _fetch_and_store(source, group, signal), groups):
+                    stamps.update(group_stamps)
+    return stamps
+
+
+def _refresh(sheet_names):
+    # On failure the stamps keep their old fetched_at, so readers go on serving
+    # the last good snapshot and the next stale read tries again.
+    try:
+        _download(sheet_names)
+        return True
+    except QuotaExhausted as error:
+        logger.warning("Deferring refresh of %r: %s", sheet_names, error)
+    except Exception:
+        logger.exception("Refresh of %r failed", sheet_names)
+    finally:
+        with _refresh_lock:
+            _refreshing.difference_update(sheet_names)
+    return False
+
+
+def _claim(sheet_names):
+    # The sheets not already being refreshed, now marked as being refreshed.
+    with _refresh_lock:
+        sheet_names = [name for name in sheet_names if name not in _refreshing]
+        _refreshing.update(sheet_names)
+    return sheet_names
+
+
+def _refresh_in_background(sheet_names):
+    sheet_names = _claim(sheet_names)
+    if sheet_names:
+        threading.Thread(target=_refresh, args=(sheet_names,), daemon=True).start()
+
+
+def refresh_snapshots(sheet_names):
+    # Synchronous refresh for callers that are already off the page's thread.
+    # False when it failed; sheets another thread is refreshing are skipped.
+    sheet_names = _claim(sheet_names)
+    return _refresh(sheet_names) if sheet_names else True
+
+
+def refresh_due_at(sheet_names):
+    # When the oldest of the snapshots turns stale; 0 if one is missing.
+    stamps = [_read_stamp(name) for name in sheet_names]
+    if any(stamp is None for stamp in stamps):
+        return 0
+    return min(stamp["fetched_at"] for stamp in stamps) + SNAPSHOT_TTL
+
+
+@st.cache_resource(max_entries=8)
+def _load_snapshot(path):
+    annotate(cache="miss")
+    if DTYPE_BACKEND == "pyarrow":
+        return pd.read_parquet(path, dtype_backend="pyarrow")
+    return pd.read_parquet(path)
+
+
+def read_snapshots(sheet_names):
+    stamps = {name: _read_stamp(name) for name in sheet_names}
+
+    missing = [name for name, stamp in stamps.items() if stamp is None]
+    if missing:
+        # Cold start with nothing on disk: the first caller downloads, the
+        # rest wait for it rather than hitting the API in parallel.
+        with span("download", sheets=missing), _fetch_lock:
+            stamps.update({name: _read_stamp(name) for name in missing})
+            missing = [name for name in missing if stamps[name] is None]
+            if missing:
+                stamps.update(_download(missing))
+
+    # Serve stale snapshots now and swap in the new ones when they land.
+    stale = [name for name, stamp in stamps.items() if time.time() - stamp["fetched_at"] > SNAPSHOT_TTL]
+    if stale:
+        _refresh_in_background(stale)
+
+    snapshots = {}
+    for name, stamp in stamps.items():
+        with span("load_snapshot", sheet=name, version=stamp["version"], cache="hit", stale=name in stale):
+            snapshots[name] = Snapshot(stamp["version"], _load_snapshot(stamp["path"]))
+    return snapshots
+
+
+def read_worksheets(sheet_names):
+    return {name: snapshot.df for name, snapshot in read_snapshots(sheet_names).items()}
+
 
-@st.cache_data(ttl=43200)
 def read_from_gsheets(sheet_name):
-    scope = ["https://www.googleapis.com/auth/spreadsheets"]
-    credentials_dict = st.secrets["gcp_service_account"]
-    credentials = ServiceAccountCredentials.from_json_keyfile_dict(credentials_dict, scope)
+    return read_worksheets([sheet_name])[sheet_name]
+
+
+@st.cache_resource(max_entries=2)
+def _bucketed_snapshots(version, _brands_df, edges, as_of):
+    annotate(cache="miss")
+    version = f"{version}-{'-'.join(map(str, edges))}"
+    if as_of is not None:
+        version = f"{version}-{as_of:%Y%m%d}"
+    return {name: Snapshot(version, df) for name, df in aggregate_brands(_brands_df, edges, as_of).items()}
 
-    gc = gspread.authorize(credentials)
-    sheet = gc.open_by_url(st.secrets["private_gsheets_url"])
 
-    worksheet = sheet.worksheet(sheet_name)
+def ingested_sheets():
+    return [BRAND_LEVEL_SHEET] if INGEST_MODE == "brands" else FRESHNESS_SHEETS
 
-    data = worksheet.get_all_values()
 
-    headers = data[0]
-    rows = data[1:]
+def read_freshness_snapshots():
+    if INGEST_MODE == "brands":
+        brands = read_snapshots([BRAND_LEVEL_SHEET])[BRAND_LEVEL_SHEET]
+        with span("bucket_brands", rows=len(brands.df), cache="hit"):
+            snapshots = _bucketed_snapshots(brands.version, brands.df, FRESHNESS_EDGES, age_as_of(brands.df))
+        # The brand rows themselves back the per-country drill-down.
+        snapshots = {**snapshots, BRAND_LEVEL_SHEET: brands}
+    else:
+        snapshots = read_snapshots(FRESHNESS_SHEETS)
 
-    df = pd.DataFrame(rows, columns=headers)
-    return df
+    history = snapshots[HISTORY_SHEET]
+    record_snapshot(history.version, history.df)
+    return snapshots
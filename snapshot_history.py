@@ -0,0 +1,171 @@
+import functools
+import glob
+import operator
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import streamlit as st
+
+from diagnostics import annotate
+from freshness_buckets import cumulative_shares, ordered_buckets
+from freshness_tables import CUMULATIVE_THRESHOLDS, build_joined_df, cumulative_column, threshold_label
+
+# Every new version of the grouped worksheet is appended here as
+# snapshot_date=YYYY-MM-DD/<version>.parquet. Files are never rewritten, and
+# readers prune on the date partition and read only the columns they ask for.
+HISTORY_DIR = os.environ.get("HISTORY_DIR", ".history")
+HISTORY_SHEET = "Brand freshness grouped"
+TREND_COLUMNS = ["snapshot_time", "tidy_country_code", "file_age_range", "pct_of_brands"]
+
+comparison_column_config = {
+    "Distinct Brand Count": st.column_config.NumberColumn(),
+    "Distinct Brand Count before": st.column_config.NumberColumn(),
+    "Δ Distinct Brand Count": st.column_config.NumberColumn(format="%+d"),
+    **{
+        column: st.column_config.NumberColumn(format=number_format)
+        for t in CUMULATIVE_THRESHOLDS
+        for column, number_format in [
+            (threshold_label(t), "%.1f%%"),
+            (f"{threshold_label(t)} before", "%.1f%%"),
+            (f"Δ {threshold_label(t)}", "%+.1f pp"),
+        ]
+    },
+}
+
+_partitioning = ds.partitioning(pa.schema([("snapshot_date", pa.string())]), flavor="hive")
+_recorded = set()
+_record_lock = threading.Lock()
+
+
+def _snapshot_files():
+    return sorted(glob.glob(os.path.join(HISTORY_DIR, "snapshot_date=*", "*.parquet")))
+
+
+def record_snapshot(version, df, now=None):
+    with _record_lock:
+        if version in _recorded:
+            return
+        _recorded.add(version)
+        if glob.glob(os.path.join(HISTORY_DIR, "snapshot_date=*", version + ".parquet")):
+            return
+
+        now = now or datetime.now(timezone.utc)
+        partition = os.path.join(HISTORY_DIR, f"snapshot_date={now:%Y-%m-%d}")
+        os.makedirs(partition, exist_ok=True)
+        path = os.path.join(partition, version + ".parquet")
+        snapshot = df.assign(snapshot_time=pd.Timestamp(now).tz_localize(None), version=version)
+        snapshot.to_parquet(path + ".tmp", index=False)
+        os.replace(path + ".tmp", path)
+
+
+def history_key():
+    # Cheap fingerprint of the store: a directory listing, no file reads.
+    return tuple(_snapshot_files())
+
+
+def _snapshot_path(version):
+    paths = glob.glob(os.path.join(HISTORY_DIR, "snapshot_date=*", version + ".parquet"))
+    if not paths:
+        raise KeyError(f"No snapshot {version!r} in {HISTORY_DIR}")
+    return paths[0]
+
+
+def read_history(columns=TREND_COLUMNS, countries=None, start=None, end=None):
+    if not _snapshot_files():
+        return pd.DataFrame(columns=columns)
+
+    filters = []
+    if start:
+        filters.append(ds.field("snapshot_date") >= str(start))
+    if end:
+        filters.append(ds.field("snapshot_date") <= str(end))
+    if countries is not None:
+        # An empty selection selects nothing, not every country.
+        if not countries:
+            return pd.DataFrame(columns=columns)
+        filters.append(ds.field("tidy_country_code").isin(list(countries)))
+
+    dataset = ds.dataset(HISTORY_DIR, format="parquet", partitioning=_partitioning)
+    condition = functools.reduce(operator.and_, filters) if filters else None
+    return dataset.to_table(columns=columns, filter=condition).to_pandas()
+
+
+@st.cache_resource(max_entries=4)
+def snapshot_versions(key):
+    # One row per stored snapshot, newest first.
+    versions = read_history(columns=["version", "snapshot_time"]).drop_duplicates("version")
+    return versions.sort_values("snapshot_time", ascending=False, ignore_index=True)
+
+
+def week_before(versions, version, days=7):
+    # The newest snapshot at least `days` older than `version`, or the oldest
+    # one there is.
+    snapshot_time = versions.loc[versions["version"] == version, "snapshot_time"].iloc[0]
+    older = versions[versions["snapshot_time"] <= snapshot_time - timedelta(days=days)]
+    return older["version"].iloc[0] if len(older) else versions["version"].iloc[-1]
+
+
+@st.cache_resource(max_entries=8)
+def snapshot_joined_table(version):
+    annotate(cache="miss")
+    return build_joined_df(pd.read_parquet(_snapshot_path(version)))
+
+
+def compare_joined(joined_df, base_joined_df, thresholds=CUMULATIVE_THRESHOLDS):
+    # One outer join on country; a country present on one side only keeps its
+    # values and gets no delta.
+    metrics = {"Distinct Brand Count": "Distinct Brand Count"}
+    metrics.update({cumulative_column(t): threshold_label(t) for t in thresholds})
+    columns = ["Country Code", *metrics]
+    merged = pd.merge(
+        joined_df[columns].astype({"Country Code": str}),
+        base_joined_df[columns].astype({"Country Code": str}),
+        on="Country Code",
+        how="outer",
+        suffixes=("", " before"),
+    )
+    compared = {"Country Code": merged["Country Code"]}
+    for column, label in metrics.items():
+        compared[label] = merged[column]
+        compared[f"{label} before"] = merged[f"{column} before"]
+        compared[f"Δ {label}"] = merged[column] - merged[f"{column} before"]
+    return pd.DataFrame(compared)
+
+
+# Cached per pair and ordering, so flipping between comparisons already made
+# is a lookup; each side's table is cached per version underneath.
+@st.cache_resource(max_entries=32)
+def snapshot_comparison(version, base_version, sort_by):
+    annotate(cache="miss")
+    compared = compare_joined(snapshot_joined_table(version), snapshot_joined_table(base_version))
+    return compared.sort_values(f"Δ {sort_by}", key=np.abs, ascending=False, na_position="last", ignore_index=True)
+
+
+@st.cache_resource(max_entries=16)
+def freshness_trend(key, countries, start=None, end=None):
+    annotate(cache="miss")
+    history = read_history(countries=countries, start=start, end=end)
+    if history.empty:
+        return pd.DataFrame(columns=["snapshot_time", "Country Code", "Threshold", "Percent of Brands"])
+
+    wide = history.pivot_table(
+        index=["snapshot_time", "tidy_country_code"],
+        columns="file_age_range",
+        values="pct_of_brands",
+        observed=True,
+    ) * 100
+    buckets = list(ordered_buckets(wide.columns).categories)
+    cumulative = cumulative_shares(wide.reindex(columns=buckets).fillna(0).to_numpy(), buckets, CUMULATIVE_THRESHOLDS)
+    trend = pd.DataFrame(
+        cumulative,
+        index=wide.index,
+        columns=[threshold_label(t) for t in CUMULATIVE_THRESHOLDS],
+    ).reset_index()
+    return trend.rename(columns={"tidy_country_code": "Country Code"}).melt(
+        id_vars=["snapshot_time", "Country Code"], var_name="Threshold", value_name="Percent of Brands"
+    )
@@ -0,0 +1,212 @@
+import collections
+import contextlib
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+
+import gspread
+import pandas as pd
+import streamlit as st
+from gspread.exceptions import APIError
+from gspread.urls import DRIVE_FILES_API_V3_URL
+from gspread.utils import absolute_range_name, fill_gaps
+from oauth2client.service_account import ServiceAccountCredentials
+from requests.exceptions import ConnectionError, Timeout
+
+# Where the worksheets come from. "gsheets" reads the private Google Sheet from
+# secrets, "files:<dir>" reads <slug>.parquet or <slug>.csv per worksheet from a
+# directory and "sqlite:<path>" reads one <slug> table per worksheet.
+DATA_SOURCE = os.environ.get("DATA_SOURCE", "gsheets")
+
+# The change check reads the file's modifiedTime from the Drive API, which
+# needs the drive.metadata.readonly scope on the service account and the Drive
+# API enabled in its GCP project (or a version_range cell in secrets, read
+# through the Sheets API instead). When the check fails the loader falls back
+# to a full download on every refresh.
+#
+# Sheets API calls this process may make per rolling minute, retries included.
+# Kept under the per-user read quota so a burst of refreshes gives up locally
+# instead of earning 429s.
+SHEETS_REQUESTS_PER_MINUTE = int(os.environ.get("SHEETS_REQUESTS_PER_MINUTE", 60))
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class QuotaExhausted(Exception):
+    pass
+
+
+def slug(sheet_name):
+    return sheet_name.lower().replace(" ", "_")
+
+
+def _open_spreadsheet():
+    scope = [
+        "https://www.googleapis.com/auth/spreadsheets",
+        "https://www.googleapis.com/auth/drive.metadata.readonly",
+    ]
+    credentials_dict = st.secrets["gcp_service_account"]
+    credentials = ServiceAccountCredentials.from_json_keyfile_dict(credentials_dict, scope)
+
+    gc = gspread.authorize(credentials)
+    return gc.open_by_url(st.secrets["private_gsheets_url"])
+
+
+class RequestBudget:
+    def __init__(self, per_minute, clock=time.monotonic):
+        self.per_minute = per_minute
+        self._clock = clock
+        self._sent = collections.deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = self._clock()
+            while self._sent and now - self._sent[0] >= 60:
+                self._sent.popleft()
+            if len(self._sent) >= self.per_minute:
+                raise QuotaExhausted(f"Sheets request budget of {self.per_minute}/min is used up")
+            self._sent.append(now)
+
+
+def _retryable(error):
+    if isinstance(error, APIError):
+        return getattr(error.response, "status_code", None) in RETRY_STATUSES
+    return isinstance(error, (ConnectionError, Timeout))
+
+
+def call_with_retry(func, budget, attempts=RETRY_ATTEMPTS):
+    # Full-jitter exponential backoff: sleep a random time up to
+    # base * 2**attempt, so concurrent callers that failed together spread out
+    # instead of retrying in lockstep. Every attempt spends from the budget.
+    for attempt in range(attempts):
+        budget.acquire()
+        try:
+            return func()
+        except Exception as error:
+            if not _retryable(error) or attempt == attempts - 1:
+                raise
+        time.sleep(random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt)))
+
+
+class SheetsSource:
+    def __init__(self, spreadsheet=None, budget=None):
+        self._spreadsheet = spreadsheet
+        self._lock = threading.Lock()
+        self.budget = budget or RequestBudget(SHEETS_REQUESTS_PER_MINUTE)
+
+    @property
+    def spreadsheet(self):
+        # Authorized once per source, under the same budget and retries as
+        # every other call; gspread refreshes the token itself.
+        with self._lock:
+            if self._spreadsheet is None:
+                self._spreadsheet = call_with_retry(_open_spreadsheet, self.budget)
+        return self._spreadsheet
+
+    def signal(self):
+        # A checksum cell maintained by the pipeline wins when configured,
+        # otherwise fall back to the file's Drive modified time.
+        version_range = st.secrets.get("version_range")
+        if version_range:
+            response = call_with_retry(lambda: self.spreadsheet.values_get(version_range), self.budget)
+            return json.dumps(response.get("values", []))
+
+        url = DRIVE_FILES_API_V3_URL + "/" + self.spreadsheet.id
+        params = {"fields": "modifiedTime", "supportsAllDrives": True}
+        response = call_with_retry(lambda: self.spreadsheet.client.request("get", url, params=params), self.budget)
+        return response.json()["modifiedTime"]
+
+    def fetch(self, sheet_names):
+        # A single values:batchGet covers every worksheet in one round-trip.
+        ranges = [absolute_range_name(name) for name in sheet_names]
+        response = call_with_retry(lambda: self.spreadsheet.values_batch_get(ranges), self.budget)
+
+        frames = {}
+        for sheet_name, value_range in zip(sheet_names, response["valueRanges"]):
+            # batchGet trims trailing empty cells, get_all_values used to pad them.
+            data = fill_gaps(value_range.get("values", [[]]))
+
+            headers = data[0]
+            rows = data[1:]
+
+            frames[sheet_name] = pd.DataFrame(rows, columns=headers)
+        return frames
+
+
+class FileSource:
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, sheet_name):
+        for extension in (".parquet", ".csv"):
+            path = os.path.join(self.directory, slug(sheet_name) + extension)
+            if os.path.exists(path):
+                return path
+        raise FileNotFoundError(f"No .parquet or .csv file for {sheet_name!r} in {self.directory}")
+
+    def signal(self):
+        stats = sorted(
+            (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith((".parquet", ".csv"))
+        )
+        return json.dumps(stats)
+
+    def fetch(self, sheet_names):
+        frames = {}
+        for sheet_name in sheet_names:
+            path = self._path(sheet_name)
+            if path.endswith(".parquet"):
+                frames[sheet_name] = pd.read_parquet(path)
+            else:
+                frames[sheet_name] = pd.read_csv(path, dtype=str, keep_default_na=False)
+        return frames
+
+
+class SQLiteSource:
+    def __init__(self, path):
+        self.path = path
+
+    def signal(self):
+        stat = os.stat(self.path)
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def fetch(self, sheet_names):
+        # sqlite3's own context manager only ends the transaction; closing()
+        # releases the connection.
+        with contextlib.closing(sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)) as conn:
+            return {
+                sheet_name: pd.read_sql_query(f'SELECT * FROM "{slug(sheet_name)}"', conn)
+                for sheet_name in sheet_names
+            }
+
+
+def _source_for(spec):
+    kind, _, location = spec.partition(":")
+    if kind == "gsheets":
+        return SheetsSource()
+    if kind == "files":
+        return FileSource(location)
+    if kind == "sqlite":
+        return SQLiteSource(location)
+    raise ValueError(f"Unknown DATA_SOURCE {spec!r}, expected gsheets, files:<dir> or sqlite:<path>")
+
+
+# One source per process, so the page and the refresh threads share its client
+# and request budget. Not st.cache_resource: refresh threads run without a
+# script run context, and there that cache neither reads nor stores entries.
+_sources = {}
+_sources_lock = threading.Lock()
+
+
+def get_source():
+    with _sources_lock:
+        if DATA_SOURCE not in _sources:
+            _sources[DATA_SOURCE] = _source_for(DATA_SOURCE)
+        return _sources[DATA_SOURCE]
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+
+from freshness_buckets import FRESHNESS_EDGES, aggregate_brands
+
+
+def country_codes(n_countries):
+    letters = np.array(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+    width = 2
+    while 26 ** width < n_countries:
+        width += 1
+    return ["".join(letters[(i // 26 ** p) % 26] for p in reversed(range(width))) for i in range(n_countries)]
+
+
+def generate_brands(n_countries=250, n_brands=100_000, max_age=365, seed=0):
+    # Brand-level rows: country sizes follow a long tail like the real data,
+    # where a handful of countries hold most of the brands.
+    rng = np.random.default_rng(seed)
+    codes = country_codes(n_countries)
+    weights = 1 / np.arange(1, n_countries + 1) ** 1.1
+    country = rng.choice(n_countries, size=n_brands, p=weights / weights.sum())
+    return pd.DataFrame({
+        "iso_country_code": pd.Categorical.from_codes(country, categories=codes),
+        "brand_id": np.char.add("brand-", np.arange(n_brands).astype(str)),
+        "brand_name": np.char.add("Brand ", rng.integers(0, n_brands, n_brands).astype(str)),
+        "poi_count": rng.zipf(1.8, n_brands).clip(1, 50_000),
+        "file_age_days": rng.gamma(1.5, 40, n_brands).clip(0, max_age).astype("int64"),
+    })
+
+
+def to_sheet_values(df):
+    # The shape values:batchGet returns: a header row then rows of strings.
+    return [list(df.columns)] + df.astype(str).values.tolist()
+
+
+def generate_sheet_values(n_countries=250, n_brands=100_000, edges=FRESHNESS_EDGES, seed=0):
+    sheets = aggregate_brands(generate_brands(n_countries, n_brands, seed=seed), edges)
+    return {name: to_sheet_values(df) for name, df in sheets.items()}
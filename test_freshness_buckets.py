@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import synthetic_data
+from freshness_buckets import FRESHNESS_EDGES, aggregate_brands, assign_buckets, bucket_labels
+
+GROUPED = "Brand freshness grouped"
+LABELS = bucket_labels(FRESHNESS_EDGES)
+
+
+def brands_frame(countries, ages, poi_count=None):
+    return pd.DataFrame({
+        "iso_country_code": pd.Categorical(countries),
+        "brand_id": [f"brand-{i}" for i in range(len(ages))],
+        "brand_name": [f"Brand {i}" for i in range(len(ages))],
+        "poi_count": poi_count if poi_count is not None else [1] * len(ages),
+        "file_age_days": ages,
+    })
+
+
+def test_boundary_ages():
+    ages = np.array([0, 30, 31, 60, 61, 90, 91, 120, 121, 400])
+    assert [LABELS[i] for i in assign_buckets(ages, FRESHNESS_EDGES)] == [
+        "0-30d", "0-30d", "31-60d", "31-60d", "61-90d", "61-90d", "91-120d", "91-120d", "120d+", "120d+",
+    ]
+
+
+@pytest.mark.parametrize("as_category", [True, False])
+def test_rows_without_a_country_are_dropped(as_category):
+    brands = brands_frame(["AA", None, "AA", "BB"], [10, 10, 200, 45], poi_count=[1, 50, 2, 4])
+    if not as_category:
+        brands["iso_country_code"] = brands["iso_country_code"].astype(object)
+    grouped = aggregate_brands(brands)[GROUPED].set_index(["tidy_country_code", "file_age_range"])
+    assert set(grouped.index.get_level_values(0)) == {"AA", "BB"}
+    assert grouped["brand_count"].sum() == 3
+    assert grouped.loc[("AA", "0-30d"), "country_poi_count"] == 3
+
+
+def test_last_updated_counts_ages_to_as_of():
+    as_of = pd.Timestamp("2024-03-01")
+    with_ages = brands_frame(["AA", "AA", "BB", "BB"], [0, 31, 120, 121])
+    with_dates = with_ages.drop(columns="file_age_days").assign(
+        last_updated=as_of - pd.to_timedelta(with_ages["file_age_days"], unit="D")
+    )
+    expected = aggregate_brands(with_ages)[GROUPED]
+    pd.testing.assert_frame_equal(aggregate_brands(with_dates, as_of=as_of)[GROUPED], expected)
+    # A day later every brand is a day older: 120 days moves out of 91-120d.
+    later = aggregate_brands(with_dates, as_of=as_of + pd.Timedelta(days=1))[GROUPED].set_index(
+        ["tidy_country_code", "file_age_range"]
+    )
+    assert later.loc[("BB", "120d+"), "brand_count"] == 2
+
+
+def test_matches_cut_and_groupby():
+    brands = synthetic_data.generate_brands(60, 20_000, seed=3)
+    grouped = aggregate_brands(brands)[GROUPED].set_index(["tidy_country_code", "file_age_range"])
+
+    bucket = pd.cut(brands["file_age_days"], [-np.inf, *FRESHNESS_EDGES, np.inf], labels=LABELS, right=True)
+    counts = brands.groupby([brands["iso_country_code"], bucket], observed=False).size()
+    counts = counts[counts.groupby(level=0, observed=False).transform("sum") > 0]
+    totals = counts.groupby(level=0, observed=False).transform("sum")
+    poi = brands.groupby("iso_country_code", observed=True)["poi_count"].sum()
+
+    counts.index = counts.index.set_names(["tidy_country_code", "file_age_range"])
+    reference = pd.DataFrame({
+        "brand_count": counts,
+        "pct_of_brands": counts / totals,
+        "country_poi_count": poi.reindex(counts.index.get_level_values(0)).to_numpy(),
+    })
+    actual = grouped.loc[reference.index, ["brand_count", "pct_of_brands", "country_poi_count"]]
+    assert len(grouped) == len(reference)
+    np.testing.assert_array_equal(actual["brand_count"], reference["brand_count"])
+    np.testing.assert_allclose(actual["pct_of_brands"], reference["pct_of_brands"])
+    np.testing.assert_array_equal(actual["country_poi_count"], reference["country_poi_count"])
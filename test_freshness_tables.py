@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import synthetic_data
+from freshness_buckets import aggregate_brands, bucket_bounds, cumulative_shares
+from freshness_tables import add_cumulative_columns, build_joined_df, cumulative_column, merge_country_tables
+
+GROUPED = "Brand freshness grouped"
+
+
+def grouped_rows(edges, n_countries=40, n_brands=3000, seed=0):
+    # Long-tail countries leave some buckets empty; the sheet omits those rows.
+    grouped = aggregate_brands(synthetic_data.generate_brands(n_countries, n_brands, seed=seed), edges)[GROUPED]
+    return grouped[grouped["brand_count"] > 0].reset_index(drop=True)
+
+
+def brute_force(grouped, threshold):
+    # Percent of each country's brands in buckets ending at or before threshold.
+    totals = {}
+    for row in grouped.itertuples():
+        upper = bucket_bounds(row.file_age_range)[1]
+        totals.setdefault(row.tidy_country_code, 0.0)
+        if upper <= threshold:
+            totals[row.tidy_country_code] += row.pct_of_brands * 100
+    return totals
+
+
+def test_matches_brute_force_on_custom_edges():
+    grouped = grouped_rows([7, 14, 30, 60, 90, 180])
+    assert (grouped.groupby("tidy_country_code", observed=True).size() < 7).any()
+    thresholds = [7, 14, 30, 60, 90, 180]
+    joined = add_cumulative_columns(merge_country_tables(grouped), thresholds)
+    for threshold in thresholds:
+        expected = brute_force(grouped, threshold)
+        actual = dict(zip(joined["Country Code"].astype(str), joined[cumulative_column(threshold)]))
+        assert actual == pytest.approx({str(code): value for code, value in expected.items()})
+
+
+def test_missing_bucket_counts_as_zero():
+    grouped = pd.DataFrame({
+        "tidy_country_code": ["AA", "AA", "AA", "BB", "BB"],
+        "file_age_range": ["0-30d", "31-60d", "120d+", "61-90d", "91-120d"],
+        "brand_count": [2, 1, 1, 3, 1],
+        "pct_of_brands": [0.5, 0.25, 0.25, 0.75, 0.25],
+        "tidy_country_rank": [1, 1, 1, 2, 2],
+    })
+    joined = build_joined_df(grouped).set_index("Country Code")
+    assert not joined.isna().any().any()
+    assert joined.loc["AA", cumulative_column(90)] == pytest.approx(75.0)
+    assert joined.loc["BB", cumulative_column(30)] == 0
+    assert joined.loc["BB", cumulative_column(90)] == pytest.approx(75.0)
+
+
+def test_threshold_between_edges_stops_at_the_last_whole_bucket():
+    buckets = ["0-30d", "31-60d", "61-90d", "91-120d", "120d+"]
+    shares = np.array([[10.0, 20.0, 30.0, 25.0, 15.0]])
+    # 45 days covers 0-30d only; 31-60d ends past it.
+    assert cumulative_shares(shares, buckets, [30, 45, 60, 119, 120]).tolist() == [[10.0, 10.0, 30.0, 60.0, 85.0]]
+
+
+def test_matches_chained_addition_on_default_buckets():
+    merged = merge_country_tables(grouped_rows([30, 60, 90, 120]))
+    joined = add_cumulative_columns(merged)
+    # The columns as they were written before the thresholds were generated.
+    under_30 = merged["0-30d"]
+    under_60 = merged["0-30d"] + merged["31-60d"]
+    under_90 = under_60 + merged["61-90d"]
+    np.testing.assert_allclose(joined[cumulative_column(30)], under_30)
+    np.testing.assert_allclose(joined[cumulative_column(60)], under_60)
+    np.testing.assert_allclose(joined[cumulative_column(90)], under_90)
@@ -0,0 +1,123 @@
+import pytest
+import streamlit as st
+from gspread.exceptions import APIError
+
+import read_data
+import sources
+import synthetic_data
+from fake_sheets import FakeSpreadsheet
+from sources import QuotaExhausted, RequestBudget, SheetsSource
+
+SHEETS = read_data.FRESHNESS_SHEETS
+WORKSHEETS = synthetic_data.generate_sheet_values(n_countries=20, n_brands=2000)
+
+
+@pytest.fixture(autouse=True)
+def offline(tmp_path, monkeypatch):
+    monkeypatch.setattr(read_data, "SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setattr(read_data, "FETCH_WORKERS", 1)
+    # No secrets.toml: the signal falls back to the Drive modified time.
+    monkeypatch.setattr(st, "secrets", {})
+    monkeypatch.setattr(sources, "RETRY_BASE_DELAY", 0.0)
+
+
+def use_fake(monkeypatch, budget=None, **kwargs):
+    fake = FakeSpreadsheet(WORKSHEETS, **kwargs)
+    source = SheetsSource(fake, budget)
+    monkeypatch.setattr(read_data, "get_source", lambda: source)
+    return fake
+
+
+def test_one_worker_fetches_every_range_in_one_request(monkeypatch):
+    fake = use_fake(monkeypatch, latency_per_range=0.2)
+    read_data.read_snapshots(SHEETS)
+    assert fake.requests == 2
+    assert fake.max_in_flight == 1
+
+
+def test_fetch_workers_split_the_batch_and_overlap(monkeypatch):
+    monkeypatch.setattr(read_data, "FETCH_WORKERS", 2)
+    fake = use_fake(monkeypatch, latency_per_range=0.2)
+    snapshots = read_data.read_snapshots(SHEETS)
+    # The signal, then one request per worksheet, served at the same time.
+    assert fake.requests == 3
+    assert fake.max_in_flight == 2
+    assert set(snapshots) == set(SHEETS)
+
+
+def test_cold_load_is_one_batched_request(monkeypatch):
+    fake = use_fake(monkeypatch)
+    snapshots = read_data.read_snapshots(SHEETS)
+    # The change signal, then a single values:batchGet for both worksheets.
+    assert fake.requests == 2
+    assert {name: len(snapshot.df) for name, snapshot in snapshots.items()} == {
+        name: len(WORKSHEETS[name]) - 1 for name in SHEETS
+    }
+
+
+def test_transient_errors_are_retried(monkeypatch):
+    fake = use_fake(monkeypatch, errors=[429, 503])
+    snapshots = read_data.read_snapshots(SHEETS)
+    assert fake.requests == 4
+    assert set(snapshots) == set(SHEETS)
+
+
+def test_client_errors_are_not_retried(monkeypatch):
+    # The change check goes through, the download gets a 400.
+    fake = use_fake(monkeypatch, errors=[None, 400])
+    with pytest.raises(APIError):
+        read_data.read_snapshots(SHEETS)
+    assert fake.requests == 2
+
+
+def test_exhausted_budget_keeps_the_last_snapshot(monkeypatch):
+    fake = use_fake(monkeypatch, budget=RequestBudget(2))
+    read_data.read_snapshots(SHEETS)
+
+    # Age the stamps and publish a new release; the refresh has no budget left.
+    for name in SHEETS:
+        stamp = read_data._read_stamp(name)
+        read_data._write_stamp(name, {**stamp, "fetched_at": stamp["fetched_at"] - read_data.SNAPSHOT_TTL - 1})
+    stamps = {name: read_data._read_stamp(name) for name in SHEETS}
+    fake.modified_time = "2023-02-01T00:00:00.000Z"
+
+    assert not read_data.refresh_snapshots(SHEETS)
+    assert fake.requests == 2
+    assert {name: read_data._read_stamp(name) for name in SHEETS} == stamps
+
+
+def test_refreshes_share_one_source_and_budget(monkeypatch):
+    # Called from here there is no script run context, as in a refresh thread.
+    fake = FakeSpreadsheet(WORKSHEETS)
+    built = []
+    monkeypatch.setattr(sources, "_sources", {})
+    monkeypatch.setattr(sources, "_source_for", lambda spec: built.append(SheetsSource(fake)) or built[-1])
+    assert read_data.refresh_snapshots(SHEETS)
+    assert read_data.refresh_snapshots(SHEETS)
+    assert len(built) == 1
+    # Signal and batch, then a signal that finds nothing changed.
+    assert len(built[0].budget._sent) == fake.requests == 3
+
+
+def test_request_budget_rolls_over_after_a_minute():
+    now = [0.0]
+    budget = RequestBudget(2, clock=lambda: now[0])
+    budget.acquire()
+    budget.acquire()
+    with pytest.raises(QuotaExhausted):
+        budget.acquire()
+    now[0] = 60.0
+    budget.acquire()
+
+
+def test_failed_change_check_falls_back_to_a_full_download(monkeypatch):
+    # A 403 from Drive, as when the API or the scope is missing.
+    fake = use_fake(monkeypatch, errors=[403])
+    snapshots = read_data.read_snapshots(SHEETS)
+    assert set(snapshots) == set(SHEETS)
+    assert fake.requests == 2
+    assert read_data._read_stamp(SHEETS[0])["signal"] is None
+
+    # With no signal on record, the next check downloads again.
+    assert read_data.refresh_snapshots(SHEETS)
+    assert fake.requests == 4